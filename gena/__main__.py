@@ -37,7 +37,7 @@ class HTTPRequestHandler(SimpleHTTPRequestHandler):
 
     def log_message(self, format, *args):
         """Logs an arbitrary message."""
-        logger.debug('%s', format % args)
+        logger.debug(format, *args)
 
     def log_request(self, code='-', size='-'):
         """Logs an accepted (successful) request."""
@@ -111,6 +111,9 @@ def _run(args):
     if args.dst is not None:
         settings.DST_DIR = args.dst
 
+    if args.watch:
+        settings.JINJA_AUTO_RELOAD = True  # templates can be changed while the server is running
+
     try:
         runner = utils.import_attr(settings.RUNNER)
         runner = runner()
@@ -55,6 +55,8 @@ def save_posts(posts: Sequence, *, directory: str, template: str, template_engin
 
     # Create a page for each blog post group (index.html...indexN.html).
     # Save this page into a given directory
+    files = []
+    render_jobs = []
     for i, group in enumerate(groups, start=1):
         template_context = {'posts': group, **extra_context, **settings}
 
@@ -71,7 +73,11 @@ def save_posts(posts: Sequence, *, directory: str, template: str, template_engin
         else:
             template_context['next_page'] = settings.BLOG_N_INDEX_FILE.format(i+1)
 
-        file.contents = template_engine.render(template, template_context)
+        files.append(file)
+        render_jobs.append((template, template_context))
+
+    for file, contents in zip(files, template_engine.render_many(render_jobs)):
+        file.contents = contents
         file.save()
 
 
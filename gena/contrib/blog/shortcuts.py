@@ -1,24 +1,26 @@
 """This module contains various shortcuts for creating processor rules more easily."""
 
+from functools import lru_cache
+
+from gena.contrib.blog.processors import BlogPostProcessor, SitemapProcessor
+from gena.processors import ProcessorSpec
+
+
 __all__ = (
     'blog_post',
     'sitemap',
 )
 
 
+@lru_cache(maxsize=None)
 def blog_post(template_engine=None):
-    return {
-        'processor': 'gena.contrib.blog.processors.BlogPostProcessor',
-        'options': {
-            'template_engine': template_engine,
-        },
-    }
+    return ProcessorSpec(BlogPostProcessor, {
+        'template_engine': template_engine,
+    })
 
 
+@lru_cache(maxsize=None)
 def sitemap(loc):
-    return {
-        'processor': 'gena.contrib.blog.processors.SitemapProcessor',
-        'options': {
-            'loc': loc,
-        },
-    }
+    return ProcessorSpec(SitemapProcessor, {
+        'loc': loc,
+    })
@@ -1,9 +1,16 @@
 """This module contains various shortcuts for creating processor rules more easily."""
 
+from gena.contrib.minifiers.processors import HTMLMinifierProcessor
+from gena.processors import ProcessorSpec
+
+
 __all__ = (
     'html_minifier',
 )
 
 
+_HTML_MINIFIER = ProcessorSpec(HTMLMinifierProcessor)
+
+
 def html_minifier():
-    return {'processor': 'gena.contrib.minifiers.processors.HTMLMinifierProcessor'}
+    return _HTML_MINIFIER
@@ -6,6 +6,11 @@ SRC_DIR = 'src'
 # The directory for processed files.
 DST_DIR = 'dist'
 
+# Names of the directories inside SRC_DIR that are skipped entirely.
+# For example:
+# IGNORE_DIRS = ['.git', 'node_modules']
+IGNORE_DIRS = []
+
 
 DEBUG = False
 
@@ -20,6 +25,11 @@ EXTRA_SETTINGS = []
 TEMPLATE_DIRS = ['templates']
 
 
+# The directory for cached data (e.g. compiled templates).
+# If it's empty, Jinja keeps its bytecode cache in a private directory inside the system temporary directory.
+# Compiled templates are cached separately for every set of Jinja options (JINJA_OPTIONS, JINJA_ASYNC, etc.).
+# Option values without a stable key (e.g. lambdas or arbitrary objects) turn the default cache off.
+# The cache can be turned off with JINJA_OPTIONS = {'bytecode_cache': None}.
 CACHE_DIR = ''
 
 
@@ -36,6 +46,12 @@ DEFAULT_FILE_FACTORY = 'gena.files.text_file'
 DEFAULT_PRIORITY = 100
 
 
+# The maximum number of threads used to process files. Files with equal priorities are processed concurrently.
+# None means the number of processors on the machine. Keep it 1 if the processing order of files matters
+# (e.g. when files are bundled up with BundleProcessor).
+WORKERS = 1
+
+
 # JOBS
 # Chains of callable objects, which are called one by one before and after the file processing.
 # For example:
@@ -60,6 +76,13 @@ FINAL_JOBS = []
 # See possible options http://jinja.pocoo.org/docs/api/#jinja2.Environment
 JINJA_OPTIONS = {}
 
+# Check if templates have been changed every time they are rendered. It's turned on automatically by `gena run -w`.
+JINJA_AUTO_RELOAD = False
+
+# Create the Jinja environment in async mode, so that templates can also be rendered with
+# JinjaTemplateEngine.render_async() from an asyncio event loop. The regular render() keeps working.
+JINJA_ASYNC = False
+
 
 # See possible options https://python-markdown.github.io/reference/#markdown
 # See the list of built-in extensions https://python-markdown.github.io/extensions/
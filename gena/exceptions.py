@@ -10,10 +10,16 @@ from gena.processors import Processor
 
 __all__ = (
     'JobError',
+    'STOP',
     'StopProcessing',
 )
 
 
+# A processor can return STOP to stop the current file processing. It's a cheaper alternative to StopProcessing
+# for the cases when no message is needed.
+STOP = object()
+
+
 class JobError(Exception):
     def __init__(self, message: str = '', job: Optional[Callable] = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
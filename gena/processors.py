@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import gzip
 import logging
-import os
 import subprocess
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from sys import stdout
-from typing import Callable, Iterable, Optional, Sequence, TypeVar, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple, TypeVar, Union
 
 from markdown import Markdown
 
@@ -29,6 +30,7 @@ __all__ = (
     'GzipProcessor',
     'MarkdownProcessor',
     'Processor',
+    'ProcessorSpec',
     'SavingProcessor',
     'StdoutProcessor',
     'TemplateProcessor',
@@ -44,8 +46,60 @@ T = TypeVar('T')
 FileCallable = Union[T, Callable[[FileLike], T]]
 
 
+_NO_OPTIONS = MappingProxyType({})
+
+
+class ProcessorSpec(Mapping):
+    """A read-only processor rule: a processor (or its import path) and options to instantiate it with.
+
+    It's a mapping with the 'processor' and 'options' keys, just like a dict rule, so it supports the same read
+    operations (spec['options'], 'options' in spec, {**spec}, dict(spec), etc.). The values are also available
+    as the `processor` and `options` attributes. The options are copied into a read-only mapping.
+
+    Since specs are immutable, copy.copy() and copy.deepcopy() return the spec itself.
+    """
+
+    __slots__ = ('processor', 'options')
+
+    _keys = ('processor', 'options')
+
+    def __init__(self, processor: Any, options: Optional[Mapping] = None) -> None:
+        object.__setattr__(self, 'processor', processor)
+        object.__setattr__(self, 'options', MappingProxyType(dict(options)) if options else _NO_OPTIONS)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(processor={self.processor!r}, options={self.options!r})'
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is read-only')
+
+    def __copy__(self) -> ProcessorSpec:
+        return self
+
+    def __deepcopy__(self, memo: Dict) -> ProcessorSpec:
+        return self
+
+    def __reduce__(self) -> Tuple:
+        return self.__class__, (self.processor, dict(self.options))
+
+
 class Processor(ABC):
-    """Abstract base class for all processors."""
+    """Abstract base class for all processors.
+
+    If `process` returns None, the processing of the file stops and the file is dropped. In order to stop
+    the processing but keep the file, return exceptions.STOP (or raise StopProcessing if a message is needed).
+    """
 
     def __init__(self, **kwargs) -> None:
         for key, value in kwargs.items():
@@ -185,18 +239,15 @@ class ExternalProcessor(Processor):
 
     def process(self, file: FileLike) -> FileLike:
         file = super().process(file)
-        curdir = os.getcwd()
-        if self.chdir is None:
-            os.chdir(file.path.directory)
-        else:
-            os.chdir(self.chdir)
+        # The working directory is passed to the child process rather than changed with os.chdir(),
+        # so that several files can be processed in parallel. EXTERNAL_PROCESSOR['cwd'] still takes precedence.
+        cwd = file.path.directory if self.chdir is None else self.chdir
         output = subprocess.run(self.command,
                                 input=file.contents,
                                 shell=False,
                                 stdout=subprocess.PIPE,
                                 text=file.is_text() or None,
-                                **settings.EXTERNAL_PROCESSOR)
-        os.chdir(curdir)
+                                **{'cwd': cwd or None, **settings.EXTERNAL_PROCESSOR})
         file.contents = output.stdout
         return file
 
@@ -1,13 +1,18 @@
 import fnmatch
+import functools
 import heapq
 import itertools
 import logging
 import os
 import re
 
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter, methodcaller
+
 from gena import utils
-from gena.exceptions import StopProcessing
+from gena.exceptions import STOP, StopProcessing
 from gena.jobs import do_final_jobs, do_initial_jobs
+from gena.processors import ProcessorSpec
 from gena.settings import settings
 
 
@@ -19,6 +24,40 @@ __all__ = (
 logger = logging.getLogger(__name__)
 
 
+_NEEDS_NORMCASE = os.path.normcase('A') != 'A'  # os.path.normcase() does nothing on POSIX systems
+
+_SIMPLE_GLOB = re.compile(r'\*\.([a-zA-Z0-9]+)\Z')  # globs like *.md, *.html, etc.
+
+
+def _get_glob_extension(pattern):
+    """Return the extension (without a dot) if the glob is as simple as *.ext, otherwise None."""
+    match = _SIMPLE_GLOB.match(pattern)
+    return match.group(1) if match else None
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_glob(pattern, is_regex=False):
+    """Compile a glob (or a regular expression if `is_regex` is True) into a search callable."""
+    if not is_regex:
+        extension = _get_glob_extension(pattern)
+        if extension:
+            return methodcaller('endswith', f'.{extension}')  # much cheaper than the equivalent regex
+        pattern = fnmatch.translate(pattern)
+    return re.compile(pattern).search
+
+
+class _Rule:
+    """A compiled processing rule."""
+
+    __slots__ = ('test', 'processors', 'file_factory', 'priority')
+
+    def __init__(self, test, processors, file_factory, priority):
+        self.test = test
+        self.processors = processors
+        self.file_factory = file_factory
+        self.priority = priority
+
+
 class FileRunner:
     def __init__(self):
         rules = settings.RULES or settings.get('PROCESSING_RULES', ())
@@ -27,24 +66,39 @@ class FileRunner:
             raise ValueError('no rules are found to process')
 
         default_file_factory = utils.import_attr(settings.DEFAULT_FILE_FACTORY)
+        default_priority = settings.DEFAULT_PRIORITY
+
+        # Shortcuts return the same read-only spec for the same arguments, so a processor that appears in several
+        # rules is created only once. Specs are referenced by `rules` the whole time, so their ids stay unique.
+        processors_by_spec = {}
 
         self._rules = []
+        extensions = []
         for rule in rules:
             if 'retest' in rule:
-                new_test = os.path.normcase(rule['retest'])
+                new_test = _compile_glob(os.path.normcase(rule['retest']), is_regex=True)
+                extensions.append(None)
                 logger.debug('Got a rule for "%s"', rule['retest'])
             else:
-                new_test = os.path.normcase(rule['test'])
-                new_test = fnmatch.translate(new_test)
+                test = os.path.normcase(rule['test'])
+                new_test = _compile_glob(test)
+                extensions.append(_get_glob_extension(test))
                 logger.debug('Got a rule for "%s"', rule['test'])
-            new_test = re.compile(new_test).search
 
             new_processors = []
             for processor in rule['processors']:
                 if processor is None:
                     continue
-                new_processor = utils.import_attr(processor['processor'])
-                new_processor = new_processor(**processor.get('options', {}))
+                new_processor = processors_by_spec.get(id(processor))
+                if new_processor is None:
+                    spec = processor
+                    if not isinstance(spec, ProcessorSpec):
+                        spec = ProcessorSpec(spec['processor'], spec.get('options', {}))
+                    processor_factory = spec.processor
+                    if not callable(processor_factory):
+                        processor_factory = utils.import_attr(processor_factory)
+                    new_processor = processor_factory(**spec.options)
+                    processors_by_spec[id(processor)] = new_processor
                 new_processors.append(new_processor.process)
 
             if 'file_factory' in rule:
@@ -52,53 +106,95 @@ class FileRunner:
             else:
                 new_file_factory = default_file_factory
 
-            new_rule = {
-                'test': new_test,
-                'processors': new_processors,
-                'file_factory': new_file_factory,
-                'priority': rule.get('priority', settings.DEFAULT_PRIORITY),
-            }
+            new_rule = _Rule(
+                test=new_test,
+                processors=new_processors,
+                file_factory=new_file_factory,
+                priority=rule.get('priority', default_priority),
+            )
             self._rules.append(new_rule)
 
+        # Rules with simple globs (*.ext) are grouped by their extensions, so that only the rules that can match
+        # a path are tested. Other rules can match any path, so they're added to every group (in the original order).
+        self._complex_rules = [rule for rule, extension in zip(self._rules, extensions) if extension is None]
+        self._rules_by_extension = {}
+        for extension in set(extensions) - {None}:
+            self._rules_by_extension[extension] = [
+                rule for rule, rule_extension in zip(self._rules, extensions) if rule_extension in (None, extension)
+            ]
+
+        # If all priorities are equal, tasks don't need to be sorted and can be yielded as soon as they're created
+        self._single_priority = len({rule.priority for rule in self._rules}) <= 1
+
     def _get_paths(self):
-        for root, _, files in os.walk(settings.SRC_DIR):
+        ignore_dirs = frozenset(settings.IGNORE_DIRS)
+        for root, dirs, files in os.walk(settings.SRC_DIR):
+            if ignore_dirs:
+                dirs[:] = [d for d in dirs if d not in ignore_dirs]  # os.walk() won't descend into the removed ones
+            if not root.endswith(os.sep):
+                root += os.sep  # plain concatenation is cheaper than os.path.join() for every file
             for file in files:
-                yield os.path.join(root, file)
+                yield root + file
 
     def _get_rule(self, path):
-        for rule in self._rules:
-            if rule['test'](os.path.normcase(path)):
+        if _NEEDS_NORMCASE:
+            path = os.path.normcase(path)
+        extension = path.rpartition('.')[2]
+        for rule in self._rules_by_extension.get(extension, self._complex_rules):
+            if rule.test(path):
                 return rule
 
     def _get_tasks(self):
         if not self._rules:
             return
 
+        debug = logger.isEnabledFor(logging.DEBUG)
         counter = itertools.count()  # the counter is needed in situations when priorities are equal
         queue = []
 
         for path in self._get_paths():
             rule = self._get_rule(path)
             if rule:
-                file = rule['file_factory'](path)
-                task = (file, rule['processors'])
-                entry = (rule['priority'], next(counter), task)
-                heapq.heappush(queue, entry)
-                logger.debug('Created a task for "%s" with priority=%s', file.path, rule['priority'])
-            else:
+                file = rule.file_factory(path)
+                task = (file, rule.processors, rule.priority)
+                if debug:
+                    logger.debug('Created a task for "%s" with priority=%s', file.path, rule.priority)
+                if self._single_priority:
+                    yield task
+                else:
+                    entry = (rule.priority, next(counter), task)
+                    heapq.heappush(queue, entry)
+            elif debug:
                 logger.debug('Skipped "%s"', path)
 
-        if queue:
-            while True:
-                try:
-                    entry = heapq.heappop(queue)  # queue entry's indexes: 0 - priority, 1 - counter, 2 - task
-                    yield entry[2]
-                except IndexError:
-                    break
+        while queue:
+            entry = heapq.heappop(queue)  # queue entry's indexes: 0 - priority, 1 - counter, 2 - task
+            yield entry[2]
 
     def is_path_applicable(self, path):
+        """Check if the file `path` is processed, i.e. it has a rule and it isn't inside IGNORE_DIRS."""
+        if settings.IGNORE_DIRS:
+            dirs = os.path.dirname(os.path.relpath(path, settings.SRC_DIR)).split(os.sep)
+            if not frozenset(settings.IGNORE_DIRS).isdisjoint(dirs):
+                return False
         return bool(self._get_rule(path))
 
+    def _run_pipeline(self, file, processors):
+        logger.info('Processing "%s"', file.path)
+        for processor in processors:
+            try:
+                result = processor(file)
+            except StopProcessing as e:
+                logger.debug('Stop processing "%s". %s', e.file, e.message)
+                break
+            if result is STOP:
+                logger.debug('Stop processing "%s"', file.path)
+                break
+            file = result
+            if file is None:  # the file has been dropped by the processor
+                break
+        return file
+
     def run(self):
         tasks = self._get_tasks()
         if not tasks:
@@ -106,17 +202,18 @@ class FileRunner:
 
         do_initial_jobs()
 
-        files = []
-        for file, processors in tasks:
-            logger.info('Processing "%s"', file.path)
-            for processor in processors:
-                try:
-                    file = processor(file)
-                except StopProcessing as e:
-                    logger.debug('Stop processing "%s". %s', e.file, e.message)
-                    break
-            files.append(file)
+        workers = settings.WORKERS or os.cpu_count() or 1  # os.cpu_count() returns None if undetermined
+        if workers > 1:
+            files = []
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Tasks with equal priorities are processed concurrently,
+                # but every priority group waits for the previous one to finish
+                for _, group in itertools.groupby(tasks, key=itemgetter(2)):
+                    futures = [executor.submit(self._run_pipeline, file, processors) for file, processors, _ in group]
+                    files.extend(future.result() for future in futures)
+        else:
+            files = [self._run_pipeline(file, processors) for file, processors, _ in tasks]
 
         do_final_jobs()
 
-        return files
+        return [file for file in files if file is not None]
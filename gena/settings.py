@@ -5,7 +5,6 @@ from inspect import getmembers
 
 from gena import default_settings
 from gena import utils
-from gena.utils import UserDict
 
 
 __all__ = (
@@ -18,18 +17,30 @@ def _get_members(obj):
     return {k: v for k, v in getmembers(obj) if k.isupper()}
 
 
-class Settings(UserDict):
+_DEFAULTS = _get_members(default_settings)  # default_settings never changes, so it's enough to grab them once
+
+
+class Settings(dict):
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.data = {**_get_members(default_settings), **self.data}
+        super().__init__(_DEFAULTS)
+        self.update(*args, **kwargs)
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        self[name] = value
 
     def __str__(self):
-        return os.linesep.join(f'{k} = {v!r}' for k, v in self.data.items())
+        return os.linesep.join(f'{k} = {v!r}' for k, v in self.items())
 
     def clear(self):
         """Return to the default settings."""
         super().clear()
-        self.data = _get_members(default_settings)
+        self.update(_DEFAULTS)
 
     def load_from_file(self, path):
         """Load settings from a file. For example:
@@ -39,7 +50,7 @@ class Settings(UserDict):
         """
 
         module = utils.import_module(path)
-        self.data.update(_get_members(module))
+        self.update(_get_members(module))
 
     def load_from_module(self, module):
         """Load settings from a module. For example:
@@ -49,7 +60,7 @@ class Settings(UserDict):
         """
 
         module = import_module(module)
-        self.data.update(_get_members(module))
+        self.update(_get_members(module))
 
 
 settings = Settings()
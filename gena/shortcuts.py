@@ -37,10 +37,16 @@ RULES = (
         ),
     },
 )
+
+Notice that shortcuts return read-only `processors.ProcessorSpec` rules, which are cached and shared between all callers.
+Processors are referenced by the classes themselves, so they don't need to be imported by their names later.
 """
 
+from functools import lru_cache
+
 from slugify import slugify
 
+from gena import processors
 from gena import utils
 
 
@@ -63,13 +69,56 @@ __all__ = (
 )
 
 
+def _processor(processor, **options):
+    """Create a read-only processor rule."""
+    return processors.ProcessorSpec(processor, options)
+
+
+_GUNZIP = _processor(processors.GunzipProcessor)
+
+_GZIP = _processor(processors.GzipProcessor)
+
+_MARKDOWN = _processor(processors.MarkdownProcessor)
+
+_META_DATE = _processor(
+    processors.FileMetaProcessor,
+    key='date',
+    callback=utils.get_datetime,
+)
+
+_META_MODIFIED = _processor(
+    processors.FileMetaProcessor,
+    key='modified',
+    callback=utils.get_datetime,
+    default=lambda file: [file.mtime],
+)
+
+_cached_slugify = lru_cache(maxsize=4096)(slugify)  # titles and other meta values often repeat
+
+_META_SLUG = _processor(
+    processors.FileMetaProcessor,
+    key='slug',
+    callback=_cached_slugify,
+    default=lambda file: file.meta.title,
+    skip_if_exists=True,
+)
+
+_STDOUT = _processor(processors.StdoutProcessor)
+
+
+def _as_command(args):
+    """Turn `args` into a hashable command. A string is a single program name, so it must not be split."""
+    return (args,) if isinstance(args, str) else tuple(args)
+
+
+@lru_cache(maxsize=None)
+def _external(command):
+    return _processor(processors.ExternalProcessor, command=command)
+
+
+@lru_cache(maxsize=None)
 def bundle(name):
-    return {
-        'processor': 'gena.processors.BundleProcessor',
-        'options': {
-            'name': name,
-        },
-    }
+    return _processor(processors.BundleProcessor, name=name)
 
 
 def cssmin(args=None):
@@ -78,75 +127,41 @@ def cssmin(args=None):
     if args is None:
         args = ('cssmin',)
 
-    return {
-        'processor': 'gena.processors.ExternalProcessor',
-        'options': {
-            'command': args,
-        },
-    }
+    return _external(_as_command(args))
 
 
+@lru_cache(maxsize=None)
 def filename(name):
-    return {
-        'processor': 'gena.processors.FileNameProcessor',
-        'options': {
-            'name': name,
-        },
-    }
+    return _processor(processors.FileNameProcessor, name=name)
 
 
+@lru_cache(maxsize=None)
 def group(name):
-    return {
-        'processor': 'gena.processors.GroupProcessor',
-        'options': {
-            'name': name,
-        },
-    }
+    return _processor(processors.GroupProcessor, name=name)
 
 
 def gunzip():
-    return {'processor': 'gena.processors.GunzipProcessor'}
+    return _GUNZIP
 
 
 def gzip():
-    return {'processor': 'gena.processors.GzipProcessor'}
+    return _GZIP
 
 
 def markdown():
-    return {'processor': 'gena.processors.MarkdownProcessor'}
+    return _MARKDOWN
 
 
 def meta_date():
-    return {
-        'processor': 'gena.processors.FileMetaProcessor',
-        'options': {
-            'key': 'date',
-            'callback': utils.get_datetime,
-        },
-    }
+    return _META_DATE
 
 
 def meta_modified():
-    return {
-        'processor': 'gena.processors.FileMetaProcessor',
-        'options': {
-            'key': 'modified',
-            'callback': utils.get_datetime,
-            'default': lambda file: [file.mtime],
-        },
-    }
+    return _META_MODIFIED
 
 
 def meta_slug():
-    return {
-        'processor': 'gena.processors.FileMetaProcessor',
-        'options': {
-            'key': 'slug',
-            'callback': slugify,
-            'default': lambda file: file.meta.title,
-            'skip_if_exists': True,
-        },
-    }
+    return _META_SLUG
 
 
 def sass(args=None):
@@ -155,36 +170,21 @@ def sass(args=None):
     if args is None:
         args = ('sass', '--stdin', '-s', 'compressed')
 
-    return {
-        'processor': 'gena.processors.ExternalProcessor',
-        'options': {
-            'command': args,
-        },
-    }
+    return _external(_as_command(args))
 
 
+@lru_cache(maxsize=None)
 def save(append=False, path=''):
-    return {
-        'processor': 'gena.processors.SavingProcessor',
-        'options': {
-            'append': append,
-            'path': path,
-        },
-    }
+    return _processor(processors.SavingProcessor, append=append, path=path)
 
 
 def stdout():
-    return {'processor': 'gena.processors.StdoutProcessor'}
+    return _STDOUT
 
 
+@lru_cache(maxsize=None)
 def template(name, engine=None):
-    return {
-        'processor': 'gena.processors.TemplateProcessor',
-        'options': {
-            'template': name,
-            'engine': engine,
-        },
-    }
+    return _processor(processors.TemplateProcessor, template=name, engine=engine)
 
 
 def uglifyjs(args=None):
@@ -193,9 +193,4 @@ def uglifyjs(args=None):
     if args is None:
         args = ('uglifyjs', '-c', '-m')
 
-    return {
-        'processor': 'gena.processors.ExternalProcessor',
-        'options': {
-            'command': args,
-        },
-    }
+    return _external(_as_command(args))
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import logging
 import os
+import types
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import jinja2
 
@@ -18,6 +24,49 @@ __all__ = (
 )
 
 
+logger = logging.getLogger(__name__)
+
+
+def _get_option_key(value: Any) -> Any:
+    """Get a key for the Jinja option value `value` which is the same in every process.
+
+    Function and class values are keyed by their qualified names (plus the values their closures refer to, e.g. for
+    jinja2.select_autoescape()). Values which can't be keyed reliably (lambdas, objects, etc.) raise TypeError.
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (tuple, list)):
+        return tuple(_get_option_key(item) for item in value)
+    if isinstance(value, (type, types.FunctionType)) and '<lambda>' not in value.__qualname__:
+        try:
+            closure = tuple(_get_option_key(cell.cell_contents) for cell in getattr(value, '__closure__', None) or ())
+        except ValueError:  # an empty cell
+            raise TypeError(f'{value!r} has no stable key') from None
+        return f'{value.__module__}.{value.__qualname__}', closure
+    raise TypeError(f'{value!r} has no stable key')
+
+
+def _get_bytecode_cache(options: Dict) -> Optional[jinja2.BytecodeCache]:
+    """Create a bytecode cache for a Jinja environment with the options `options`.
+
+    Templates are compiled differently depending on the options (e.g. autoescape or enable_async), but Jinja's cache
+    keys only depend on template names and sources. So every set of options gets its own cache files. If the options
+    can't be keyed the same way in every build, no cache is created, so stale cache files don't pile up.
+    """
+    try:
+        options_key = sorted((name, _get_option_key(value)) for name, value in options.items())
+    except TypeError as e:
+        logger.debug('Jinja bytecode cache is turned off: %s', e)
+        return None
+    digest = hashlib.sha1(repr(options_key).encode()).hexdigest()[:16]
+    if settings.CACHE_DIR:
+        cache_dir = os.path.join(settings.CACHE_DIR, 'jinja')
+        os.makedirs(cache_dir, exist_ok=True)
+        return jinja2.FileSystemBytecodeCache(cache_dir, f'%s.{digest}.cache')
+    # Jinja uses a private directory in the system temp dir
+    return jinja2.FileSystemBytecodeCache(pattern=f'__jinja2_%s.{digest}.cache')
+
+
 class TemplateEngine(ABC):
     """Abstract base class for all template engines."""
 
@@ -26,25 +75,66 @@ class TemplateEngine(ABC):
         """Render templates."""
         pass
 
+    def render_many(self, jobs: Iterable[Tuple[str, Optional[Dict]]]) -> List[str]:
+        """Render several templates at once. `jobs` is an iterable of (template, context) pairs."""
+        return [self.render(template, context) for template, context in jobs]
+
 
 class JinjaTemplateEngine(TemplateEngine):
     """Jinja2 template engine."""
 
     def __init__(self) -> None:
+        self._environment = None  # created on first use, so unused engines don't touch the disk
+        self._template_getter = None
+
+    @property
+    def _jinja_environment(self) -> jinja2.Environment:
+        if self._environment is None:
+            self._environment = self._create_environment()
+        return self._environment
+
+    @staticmethod
+    def _create_environment() -> jinja2.Environment:
         jinja_loader = jinja2.FileSystemLoader(settings.TEMPLATE_DIRS)
-        if settings.CACHE_DIR:
-            cache_dir = os.path.join(settings.CACHE_DIR, 'jinja')
-            if not os.path.exists(cache_dir):
-                os.makedirs(cache_dir)
-            jinja_cache: Optional[jinja2.BytecodeCache] = jinja2.FileSystemBytecodeCache(cache_dir, '%s.cache')
-        else:
-            jinja_cache = None
+        jinja_options = {
+            'auto_reload': settings.JINJA_AUTO_RELOAD,
+            'enable_async': settings.JINJA_ASYNC,
+            **settings.JINJA_OPTIONS,
+        }
+        if 'bytecode_cache' not in jinja_options:  # JINJA_OPTIONS = {'bytecode_cache': None} turns the cache off
+            jinja_options['bytecode_cache'] = _get_bytecode_cache(jinja_options)
+        return jinja2.Environment(loader=jinja_loader, **jinja_options)
 
-        self._jinja_environment = jinja2.Environment(loader=jinja_loader, bytecode_cache=jinja_cache,
-                                                     **settings.JINJA_OPTIONS)
+    def _get_template(self, template: str) -> jinja2.Template:
+        if self._template_getter is None:
+            jinja_environment = self._jinja_environment
+            if jinja_environment.auto_reload:
+                self._template_getter = jinja_environment.get_template
+            else:  # templates never change, so every template is loaded only once
+                self._template_getter = functools.lru_cache(maxsize=None)(jinja_environment.get_template)
+        return self._template_getter(template)
 
     def render(self, template: str, context: Optional[Dict] = None) -> str:
-        jinja_template = self._jinja_environment.get_template(template)
+        if self._jinja_environment.is_async:
+            # Jinja 2 renders async templates in the current event loop, which doesn't exist in worker threads
+            # (or after asyncio.run()), so every rendering gets its own loop
+            return asyncio.run(self.render_async(template, context))
+        jinja_template = self._get_template(template)
         if context:
             return jinja_template.render(context)
         return jinja_template.render()
+
+    async def render_async(self, template: str, context: Optional[Dict] = None) -> str:
+        """Render templates in an asyncio event loop. It requires JINJA_ASYNC to be turned on."""
+        jinja_template = self._get_template(template)
+        if context:
+            return await jinja_template.render_async(context)
+        return await jinja_template.render_async()
+
+    def render_many(self, jobs: Iterable[Tuple[str, Optional[Dict]]]) -> List[str]:
+        """Render several templates concurrently (up to WORKERS threads). The results keep the order of `jobs`."""
+        workers = settings.WORKERS or os.cpu_count() or 1  # os.cpu_count() returns None if undetermined
+        if workers <= 1:
+            return super().render_many(jobs)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda job: self.render(*job), jobs))
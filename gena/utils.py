@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import collections
+import functools
 import importlib.util
 import os
 
 from datetime import datetime
 from types import ModuleType
-from typing import Any
+from typing import Any, Dict, Tuple
 
 from dateutil.parser import parse as timestrparse
 
@@ -21,21 +22,31 @@ __all__ = (
 
 
 def fspath(path):
+    if type(path) is str:  # the most common case
+        return path
     new_path = os.fspath(path)
     if isinstance(new_path, bytes):
         return os.fsdecode(new_path)
     return new_path
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime(s):
+    """Parse a date/time string. The same strings (e.g. meta dates) often repeat, so the results are cached."""
+    return timestrparse(s)
+
+
 def get_datetime(s, *args, **kwargs):
     if isinstance(s, datetime):
         return s
-    try:
+    if isinstance(s, (int, float)):
         return datetime.fromtimestamp(s)
-    except TypeError:
+    if args or kwargs:
         return timestrparse(s, *args, **kwargs)
+    return _parse_datetime(s)
 
 
+@functools.lru_cache(maxsize=None)
 def import_attr(attr: str) -> Any:
     """Import a module attribute. For example:
 
@@ -43,6 +54,7 @@ def import_attr(attr: str) -> Any:
     runner = gena.utils.import_attr('gena.runners.FileRunner')
 
     It returns the FileRunner object from the gena.runners module.
+    The result is cached, so every attribute is imported only once.
     """
 
     module_name, attr_name = attr.strip().rsplit('.', 1)
@@ -50,31 +62,46 @@ def import_attr(attr: str) -> Any:
     return getattr(module, attr_name)
 
 
+_imported_modules: Dict[str, Tuple[int, ModuleType]] = {}  # absolute path -> (modification time, module)
+
+
 def import_module(path: str) -> ModuleType:
     """Import a module. For example:
 
     import gena.utils
     user_settings = gena.utils.import_module('/home/user/settings.py')
+
+    The module is executed again only if its file has been modified since the last import.
     """
 
     name = os.path.basename(path)
     if not name:
         raise ImportError(f'cannot import "{path}"')
+    abspath = os.path.abspath(path)
+    mtime = os.stat(abspath).st_mtime_ns
+    imported = _imported_modules.get(abspath)
+    if imported and imported[0] == mtime:
+        return imported[1]
     name = os.path.splitext(name)[0]
     spec = importlib.util.spec_from_file_location(name, path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    _imported_modules[abspath] = (mtime, module)  # replaces the stale module if there is one
     return module
 
 
 def map_as_kwargs(m):
-    return ', '.join(f'{k}={v!r}' for k, v in m.items())
+    return ', '.join([f'{k}={v!r}' for k, v in m.items()])  # str.join() turns a generator into a list anyway
 
 
 class UserDict(collections.UserDict):
     def __getattr__(self, name):
-        if name in self:
-            return self.data[name]
+        data = self.__dict__.get('data')  # `data` may not exist yet (e.g. while unpickling)
+        if data is not None:
+            try:
+                return data[name]
+            except KeyError:
+                pass
         raise AttributeError(name)
 
     def __setattr__(self, name, value):
@@ -21,6 +21,8 @@ EXTRAS = {
 
 BASE_DIR = os.path.dirname(__file__)
 
+VERSION_RE = re.compile(r'__version__\s*=\s*[\'"]([^\'"]*)[\'"]')
+
 
 def get_file_contents(*paths):
     path = os.path.join(BASE_DIR, *paths)
@@ -33,10 +35,12 @@ def get_long_description():
 
 
 def get_version():
-    file_contents = get_file_contents('gena', '__init__.py')
-    version = re.match(r'^__version__\s*=\s*[\'"]([^\'"]*)[\'"]', file_contents, re.M)
-    if version:
-        return version.group(1)
+    path = os.path.join(BASE_DIR, 'gena', '__init__.py')
+    with open(path) as file:
+        for line in file:  # stop reading as soon as the version is found
+            version = VERSION_RE.match(line)
+            if version:
+                return version.group(1)
     raise RuntimeError('Unable to find version string.')
 
 
@@ -52,7 +56,7 @@ setup(
     python_requires='>=3.7',
     install_requires=REQUIREMENTS,
     extras_require=EXTRAS,
-    tests_require=['pytest'],
+    tests_require=['pyfakefs', 'pytest'],
     packages=find_packages(exclude=['tests']),
     zip_safe=False,
     classifiers=[
@@ -0,0 +1,28 @@
+import os.path
+
+from dataclasses import dataclass
+
+
+BASE_DIR = os.path.dirname(__file__)
+DATA_DIR = os.path.join(BASE_DIR, 'data')
+OUTPUT_DIR = os.path.join(DATA_DIR, 'output')
+TEMPLATES_DIR = os.path.join(DATA_DIR, 'templates')
+UTILS_DIR = os.path.join(BASE_DIR, 'utils')
+
+
+@dataclass
+class SampleArticlePath:
+    directory: str = DATA_DIR
+    basename: str = 'article'
+    extension: str = '.md'
+
+    def __fspath__(self):
+        return self.path
+
+    @property
+    def name(self) -> str:
+        return f'{self.basename}{self.extension}'
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, self.name)
@@ -1,33 +1,19 @@
 import pytest
-import os
 
-from dataclasses import dataclass
+from gzip import GzipFile
+from io import BytesIO
+from pathlib import Path
 
 from gena.context import context as gena_context
 from gena.files import File, FileType
 from gena.settings import settings as gena_settings
 
+from ._paths import OUTPUT_DIR, SampleArticlePath
 
-BASE_DIR = os.path.dirname(__file__)
-DATA_DIR = os.path.join(BASE_DIR, 'data')
 
-
-@dataclass
-class SampleArticlePath:
-    directory: str = DATA_DIR
-    basename: str = 'article'
-    extension: str = '.md'
-
-    def __fspath__(self):
-        return self.path
-
-    @property
-    def name(self) -> str:
-        return os.path.join(f'{self.basename}{self.extension}')
-
-    @property
-    def path(self) -> str:
-        return os.path.join(self.directory, self.name)
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'slow: tests that spawn processes (deselect with -m "not slow")')
+    config.addinivalue_line('markers', 'xdist_group(name): run the tests on the same worker with --dist=loadgroup')
 
 
 @pytest.fixture
@@ -35,6 +21,11 @@ def sample_article_path():
     return SampleArticlePath()
 
 
+@pytest.fixture
+def sample_article_path_html():
+    return SampleArticlePath(extension='.html')
+
+
 @pytest.fixture(scope='session')
 def sample_article_as_bytes():
     with open(SampleArticlePath(), 'rb') as file:
@@ -43,10 +34,43 @@ def sample_article_as_bytes():
 
 @pytest.fixture(scope='session')
 def sample_article_as_str():
-    with open(SampleArticlePath(), 'rt') as file:
+    with open(SampleArticlePath(), 'rt', encoding='utf-8') as file:
         return file.read()
 
 
+@pytest.fixture(scope='session')
+def sample_article_html():
+    """The sample article converted from Markdown."""
+    return Path(OUTPUT_DIR, 'article.html').read_text(encoding='utf-8')
+
+
+@pytest.fixture(scope='session')
+def sample_rendered_html():
+    """The sample article rendered with the article.html template."""
+    return Path(OUTPUT_DIR, 'gateway-ridge.html').read_text(encoding='utf-8')
+
+
+@pytest.fixture(scope='session')
+def sample_minified_html():
+    """The rendered sample article after minification."""
+    return Path(OUTPUT_DIR, 'gateway-ridge.min.html').read_text(encoding='utf-8')
+
+
+@pytest.fixture(scope='session')
+def article_gzipped_contents(sample_article_as_bytes):
+    """The sample article compressed just like tests/utils/gzippy does it."""
+    buffer = BytesIO()
+    with GzipFile(fileobj=buffer, mode='wb', mtime=0) as file:  # gzip.compress() has no mtime argument in 3.7
+        file.write(sample_article_as_bytes)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope='session')
+def article_uppercased_contents(sample_article_as_str):
+    """The sample article uppercased just like tests/utils/uppercaser does it."""
+    return sample_article_as_str.upper()
+
+
 @pytest.fixture
 def article_binary_file(sample_article_path):
     return File(sample_article_path, type=FileType.BINARY)
@@ -1,19 +1,18 @@
-import os.path
+import pytest
 
 from gena.contrib.minifiers import HTMLMinifierProcessor
 from gena.files import File
 
+from ._paths import OUTPUT_DIR
 
-BASE_DIR = os.path.dirname(__file__)
-DATA_DIR = os.path.join(BASE_DIR, 'data')
-OUTPUT_DIR = os.path.join(DATA_DIR, 'output')
+
+@pytest.fixture(scope='class')
+def html_minifier():
+    return HTMLMinifierProcessor()
 
 
 class TestHTMLMinifierProcessor:
-    def test_processing(self):
-        with open(os.path.join(OUTPUT_DIR, 'gateway-ridge.min.html')) as file:
-            sample_contents = file.read()
+    def test_processing(self, html_minifier, sample_minified_html):
         input_file = File(OUTPUT_DIR, 'gateway-ridge.html')
-        processor = HTMLMinifierProcessor()
-        output_file = processor.process(input_file)
-        assert output_file.contents == sample_contents
+        output_file = html_minifier.process(input_file)
+        assert output_file.contents == sample_minified_html
@@ -1,12 +1,28 @@
 import pytest
 import os
 
+from pathlib import Path
+
 from gena.files import FilePath, FileType
 
+from ._paths import SampleArticlePath
+
+
+@pytest.fixture(scope='class')
+def article_file_path_template():
+    return FilePath(SampleArticlePath())
+
 
 @pytest.fixture
-def article_file_path(sample_article_path):
-    return FilePath(sample_article_path)
+def article_file_path(article_file_path_template):
+    return article_file_path_template.copy()  # tests change the path, so each of them gets its own copy
+
+
+@pytest.fixture
+def fake_tmp_path(fs, sample_article_path):
+    """An empty directory in the in-memory file system of pyfakefs. The sample files are still readable."""
+    fs.add_real_directory(sample_article_path.directory)
+    return Path(fs.create_dir('/tmp/gena').path)
 
 
 class TestFilePath:
@@ -115,41 +131,39 @@ class TestBinaryFile:
         assert article_binary_file.type == FileType.TEXT
         assert article_binary_file.contents == sample_article_as_str
 
-    def test_is_binary_method(self, article_binary_file):
-        assert article_binary_file.is_binary()
+    @pytest.mark.parametrize('method, expected', (('is_binary', True), ('is_text', False)))
+    def test_type_methods(self, article_binary_file, expected, method):
+        assert getattr(article_binary_file, method)() is expected
 
-    def test_is_text_method(self, article_binary_file):
-        assert not article_binary_file.is_text()
-
-    def test_saving_file_when_path_changed(self, article_binary_file, sample_article_as_bytes, tmpdir):
-        tmpfile = tmpdir.join(article_binary_file.path.name)
+    def test_saving_file_when_path_changed(self, article_binary_file, sample_article_as_bytes, fake_tmp_path):
+        tmpfile = fake_tmp_path / article_binary_file.path.name
         article_binary_file.path.path = tmpfile
         assert article_binary_file.save()
-        assert tmpfile.read_binary() == sample_article_as_bytes
+        assert tmpfile.read_bytes() == sample_article_as_bytes
         assert not article_binary_file.save()  # the file isn't changed since the last saving
 
     def test_saving_file_when_contents_changed(self, article_binary_file):
         article_binary_file.contents = b'test'
         assert not article_binary_file.save()
 
-    def test_saving_file_when_path_and_contents_changed(self, article_binary_file, tmpdir):
-        tmpfile = tmpdir.join(article_binary_file.path.name)
+    def test_saving_file_when_path_and_contents_changed(self, article_binary_file, fake_tmp_path):
+        tmpfile = fake_tmp_path / article_binary_file.path.name
         article_binary_file.path.path = tmpfile
         article_binary_file.contents = b'test'
         assert article_binary_file.save()
-        assert tmpfile.read_binary() == b'test'
+        assert tmpfile.read_bytes() == b'test'
         assert not article_binary_file.save()
 
     def test_saving_file_when_nothing_changed(self, article_binary_file):
         assert not article_binary_file.save()
 
-    def test_saving_with_appending_to_existing_file(self, article_binary_file, tmpdir):
-        tmpfile = tmpdir.join(article_binary_file.path.name)
-        tmpfile.write_binary(b'test1')
+    def test_saving_with_appending_to_existing_file(self, article_binary_file, fake_tmp_path):
+        tmpfile = fake_tmp_path / article_binary_file.path.name
+        tmpfile.write_bytes(b'test1')
         article_binary_file.path.path = tmpfile
         article_binary_file.contents = b'test2'
         assert article_binary_file.save(append=True)
-        assert tmpfile.read_binary() == b'test1test2'
+        assert tmpfile.read_bytes() == b'test1test2'
         assert not article_binary_file.save()
 
 
@@ -192,39 +206,37 @@ class TestTextFile:
         assert article_text_file.type == FileType.BINARY
         assert article_text_file.contents == sample_article_as_bytes
 
-    def test_is_binary_method(self, article_text_file):
-        assert not article_text_file.is_binary()
-
-    def test_is_text_method(self, article_text_file):
-        assert article_text_file.is_text()
+    @pytest.mark.parametrize('method, expected', (('is_binary', False), ('is_text', True)))
+    def test_type_methods(self, article_text_file, expected, method):
+        assert getattr(article_text_file, method)() is expected
 
-    def test_saving_file_when_path_changed(self, article_text_file, sample_article_as_str, tmpdir):
-        tmpfile = tmpdir.join(article_text_file.path.name)
+    def test_saving_file_when_path_changed(self, article_text_file, sample_article_as_str, fake_tmp_path):
+        tmpfile = fake_tmp_path / article_text_file.path.name
         article_text_file.path.path = tmpfile
         assert article_text_file.save()
-        assert tmpfile.read() == sample_article_as_str
+        assert tmpfile.read_text(encoding='utf-8') == sample_article_as_str
         assert not article_text_file.save()  # the file isn't changed since the last saving
 
     def test_saving_file_when_contents_changed(self, article_text_file):
         article_text_file.contents = 'test'
         assert not article_text_file.save()
 
-    def test_saving_file_when_path_and_contents_changed(self, article_text_file, tmpdir):
-        tmpfile = tmpdir.join(article_text_file.path.name)
+    def test_saving_file_when_path_and_contents_changed(self, article_text_file, fake_tmp_path):
+        tmpfile = fake_tmp_path / article_text_file.path.name
         article_text_file.path.path = tmpfile
         article_text_file.contents = 'test'
         assert article_text_file.save()
-        assert tmpfile.read() == 'test'
+        assert tmpfile.read_text(encoding='utf-8') == 'test'
         assert not article_text_file.save()
 
     def test_saving_file_when_nothing_changed(self, article_text_file):
         assert not article_text_file.save()
 
-    def test_saving_with_appending_to_existing_file(self, article_text_file, tmpdir):
-        tmpfile = tmpdir.join(article_text_file.path.name)
-        tmpfile.write('test1')
+    def test_saving_with_appending_to_existing_file(self, article_text_file, fake_tmp_path):
+        tmpfile = fake_tmp_path / article_text_file.path.name
+        tmpfile.write_text('test1', encoding='utf-8')
         article_text_file.path.path = tmpfile
         article_text_file.contents = 'test2'
         assert article_text_file.save(append=True)
-        assert tmpfile.read() == 'test1test2'
+        assert tmpfile.read_text(encoding='utf-8') == 'test1test2'
         assert not article_text_file.save()
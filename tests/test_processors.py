@@ -1,56 +1,86 @@
-import os.path
+import pytest
+import subprocess
 import sys
 
-from gzip import compress
+from os.path import join
 from string import capwords
 
 from gena.files import File, FileType
-from gena.processors import *
-
-
-BASE_DIR = os.path.dirname(__file__)
-DATA_DIR = os.path.join(BASE_DIR, 'data')
-OUTPUT_DIR = os.path.join(DATA_DIR, 'output')
-TEMPLATES_DIR = os.path.join(DATA_DIR, 'templates')
-UTILS_DIR = os.path.join(BASE_DIR, 'utils')
-
-
+from gena.processors import (
+    BundleProcessor,
+    ExternalProcessor,
+    FileMetaProcessor,
+    FileNameProcessor,
+    GroupProcessor,
+    MarkdownProcessor,
+    SavingProcessor,
+    TemplateProcessor,
+    TypeProcessor,
+)
+
+from ._paths import OUTPUT_DIR, TEMPLATES_DIR, UTILS_DIR
+
+
+@pytest.mark.xdist_group('context')
 class TestBundleProcessor:
-    def test_binary_file_processing(self, context):
-        file1 = File('file1', type=FileType.BINARY)
-        file1.contents = b'test1'
-        file2 = File('file2', type=FileType.BINARY)
-        file2.contents = b'test2'
-        processor = BundleProcessor(name='test')
-        processor.process(file1)
-        processor.process(file2)
-        assert context.test == b'test1test2'
-
-    def test_text_file_processing(self, context):
-        file1 = File('file1')
-        file1.contents = 'test1'
-        file2 = File('file2')
-        file2.contents = 'test2'
+    @pytest.mark.parametrize('file_type, contents1, contents2', (
+        (FileType.BINARY, b'test1', b'test2'),
+        (FileType.TEXT, 'test1', 'test2'),
+    ), ids=('binary', 'text'))
+    def test_processing(self, context, file_type, contents1, contents2):
+        file1 = File('file1', type=file_type)
+        file1.contents = contents1
+        file2 = File('file2', type=file_type)
+        file2.contents = contents2
         processor = BundleProcessor(name='test')
         processor.process(file1)
         processor.process(file2)
-        assert context.test == 'test1test2'
+        assert context.test == contents1 + contents2
 
 
 class TestExternalProcessor:
-    def test_binary_file_processing(self, article_binary_file):
-        gzipped_contents = compress(article_binary_file.contents)
-        util = os.path.join(UTILS_DIR, 'gzippy')
-        processor = ExternalProcessor(command=[sys.executable, util])
-        output_file = processor.process(article_binary_file)
-        assert output_file.contents == gzipped_contents
-
-    def test_text_file_processing(self, article_text_file):
-        uppercased_contents = article_text_file.contents.upper()
-        util = os.path.join(UTILS_DIR, 'uppercaser')
-        processor = ExternalProcessor(command=[sys.executable, util])
+    @pytest.mark.slow
+    @pytest.mark.parametrize('file_fixture, util, contents_fixture', (
+        ('article_binary_file', 'gzippy', 'article_gzipped_contents'),
+        ('article_text_file', 'uppercaser', 'article_uppercased_contents'),
+    ), ids=('binary', 'text'))
+    def test_processing(self, contents_fixture, file_fixture, request, util):
+        file = request.getfixturevalue(file_fixture)
+        processor = ExternalProcessor(command=[sys.executable, join(UTILS_DIR, util)])
+        output_file = processor.process(file)
+        assert output_file.contents == request.getfixturevalue(contents_fixture)
+
+    def test_processing_without_subprocess(self, article_text_file, monkeypatch):
+        calls = []
+
+        def run(command, **kwargs):
+            calls.append((command, kwargs))
+            return subprocess.CompletedProcess(command, 0, stdout=kwargs['input'].upper())
+
+        monkeypatch.setattr(subprocess, 'run', run)
+        contents = article_text_file.contents
+        processor = ExternalProcessor(command=['uppercaser'])
         output_file = processor.process(article_text_file)
-        assert output_file.contents == uppercased_contents
+        assert output_file.contents == contents.upper()
+        [(command, kwargs)] = calls
+        assert command == ['uppercaser']
+        assert kwargs['input'] == contents
+        assert kwargs['stdout'] == subprocess.PIPE
+        assert kwargs['text']
+        assert kwargs['cwd'] == article_text_file.path.directory
+
+    def test_processing_with_cwd_setting(self, article_text_file, monkeypatch, settings, tmp_path):
+        calls = []
+
+        def run(command, **kwargs):
+            calls.append(kwargs)
+            return subprocess.CompletedProcess(command, 0, stdout=kwargs['input'])
+
+        monkeypatch.setattr(subprocess, 'run', run)
+        settings.EXTERNAL_PROCESSOR = {'cwd': str(tmp_path)}
+        processor = ExternalProcessor(command=['cat'])
+        processor.process(article_text_file)
+        assert calls[0]['cwd'] == str(tmp_path)
 
 
 class TestFileMetaProcessor:
@@ -97,21 +127,20 @@ class TestFileMetaProcessor:
 
 
 class TestFileNameProcessor:
-    def test_processing_when_name_is_string(self, article_text_file, sample_article_path):
-        sample_article_path.extension = '.html'
-        processor = FileNameProcessor(name=sample_article_path.name)
-        output_file = processor.process(article_text_file)
-        assert output_file.path.name == sample_article_path.name
-        assert output_file.path.path == sample_article_path.path
-
-    def test_processing_when_name_is_callable(self, article_text_file, sample_article_path):
-        sample_article_path.extension = '.html'
-        processor = FileNameProcessor(name=lambda file: f'{file.path.basename}{sample_article_path.extension}')
+    @pytest.mark.parametrize('name_is_callable', (False, True), ids=('string', 'callable'))
+    def test_processing(self, article_text_file, name_is_callable, sample_article_path_html):
+        if name_is_callable:
+            def name(file):
+                return f'{file.path.basename}{sample_article_path_html.extension}'
+        else:
+            name = sample_article_path_html.name
+        processor = FileNameProcessor(name=name)
         output_file = processor.process(article_text_file)
-        assert output_file.path.name == sample_article_path.name
-        assert output_file.path.path == sample_article_path.path
+        assert output_file.path.name == sample_article_path_html.name
+        assert output_file.path.path == sample_article_path_html.path
 
 
+@pytest.mark.xdist_group('context')
 class TestGroupProcessor:
     def test_processing(self, context):
         file1 = File('file1')
@@ -122,25 +151,29 @@ class TestGroupProcessor:
         assert context.test == [file1, file2]
 
 
+@pytest.fixture(scope='class')
+def template_processor():
+    return TemplateProcessor(template='article.html')
+
+
 class TestTemplateProcessor:
-    def test_processing(self, settings):
-        with open(os.path.join(OUTPUT_DIR, 'gateway-ridge.html')) as file:
-            sample_contents = file.read()
+    def test_processing(self, sample_rendered_html, settings, template_processor):
         input_file = File(OUTPUT_DIR, 'article.html')
         input_file.meta['title'] = ['Gateway Ridge']
-        settings.TEMPLATE_DIRS = TEMPLATES_DIR
-        processor = TemplateProcessor(template='article.html')
-        output_file = processor.process(input_file)
-        assert output_file.contents == sample_contents
+        settings.TEMPLATE_DIRS = TEMPLATES_DIR  # the Jinja environment is created on the first rendering
+        output_file = template_processor.process(input_file)
+        assert output_file.contents == sample_rendered_html
+
+
+@pytest.fixture(scope='class')
+def markdown_processor():
+    return MarkdownProcessor()
 
 
 class TestMarkdownProcessor:
-    def test_processing(self, article_text_file):
-        with open(os.path.join(OUTPUT_DIR, 'article.html')) as file:
-            sample_contents = file.read()
-        processor = MarkdownProcessor()
-        output_file = processor.process(article_text_file)
-        assert output_file.contents == sample_contents
+    def test_processing(self, article_text_file, markdown_processor, sample_article_html):
+        output_file = markdown_processor.process(article_text_file)
+        assert output_file.contents == sample_article_html
         assert output_file.meta.title == ['Gateway Ridge']
         assert output_file.meta.date == ['20:29, 10 November 2010']
         assert output_file.meta.source == ['Wikipedia']
@@ -149,12 +182,12 @@ class TestMarkdownProcessor:
 
 
 class TestSavingProcessor:
-    def test_processing(self, article_text_file, sample_article_as_str, settings, tmpdir):
-        tmpfile = tmpdir.join(article_text_file.path.name)
-        settings.DST_DIR = tmpfile.dirpath()
+    def test_processing(self, article_text_file, sample_article_as_str, settings, tmp_path):
+        tmpfile = tmp_path / article_text_file.path.name
+        settings.DST_DIR = tmp_path
         processor = SavingProcessor()
         processor.process(article_text_file)
-        assert tmpfile.read() == sample_article_as_str
+        assert tmpfile.read_text(encoding='utf-8') == sample_article_as_str
 
 
 class TestTypeProcessor:
@@ -0,0 +1,150 @@
+import pytest
+import os
+import sys
+import time
+
+from gena.exceptions import STOP, StopProcessing
+from gena.processors import ExternalProcessor, Processor
+from gena.runners import FileRunner
+
+
+class RecordingProcessor(Processor):
+    """Record when the processing of every file starts and ends."""
+
+    def process(self, file):
+        self.events.append(('start', file.path.name))
+        time.sleep(self.delay)
+        self.events.append(('end', file.path.name))
+        return file
+
+
+class DroppingProcessor(Processor):
+    def process(self, file):
+        return None
+
+
+class StoppingProcessor(Processor):
+    def process(self, file):
+        return STOP
+
+
+class RaisingProcessor(Processor):
+    def process(self, file):
+        raise StopProcessing('test', processor=self, file=file)
+
+
+class FailingProcessor(Processor):
+    """Fail if the processing hasn't been stopped before this processor."""
+
+    def process(self, file):
+        raise AssertionError(f'"{file.path}" must not be processed by {self.__class__.__name__}')
+
+
+@pytest.fixture
+def src_dir(settings, tmp_path):
+    src_dir = tmp_path / 'src'
+    for name in ('a.md', 'b.md', 'c.md', 'x.txt', 'y.txt', os.path.join('sub', 'd.md'), os.path.join('sub', 'z.txt')):
+        path = src_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name, encoding='utf-8')
+    settings.SRC_DIR = str(src_dir)
+    return src_dir
+
+
+def _get_names(files, src_dir):
+    return [os.path.relpath(file.path.path, src_dir) for file in files]
+
+
+class TestFileRunner:
+    @pytest.mark.parametrize('workers', (2, None))
+    def test_running_with_workers(self, settings, src_dir, workers):
+        events = []
+        settings.RULES = [
+            {
+                'test': '*.md',
+                'priority': 1,
+                'processors': [{'processor': RecordingProcessor, 'options': {'events': events, 'delay': 0.01}}],
+            },
+            {
+                'test': '*.txt',
+                'priority': 2,
+                'processors': [{'processor': RecordingProcessor, 'options': {'events': events, 'delay': 0}}],
+            },
+        ]
+        sequential_names = _get_names(FileRunner().run(), src_dir)
+        events.clear()
+
+        settings.WORKERS = workers
+        names = _get_names(FileRunner().run(), src_dir)
+
+        assert names == sequential_names
+        assert sorted(names[:4]) == ['a.md', 'b.md', 'c.md', os.path.join('sub', 'd.md')]
+        # The *.txt files (priority 2) wait until all the *.md files (priority 1) are processed
+        last_md_end = max(i for i, (event, name) in enumerate(events) if event == 'end' and name.endswith('.md'))
+        first_txt_start = min(i for i, (event, name) in enumerate(events) if event == 'start' and name.endswith('.txt'))
+        assert last_md_end < first_txt_start
+
+    @pytest.mark.slow
+    def test_running_external_processors_with_workers(self, settings, src_dir):
+        command = [sys.executable, '-c', 'import os, sys; sys.stdin.read(); print(os.getcwd(), end="")']
+        settings.RULES = [
+            {'test': '*.txt', 'processors': [{'processor': ExternalProcessor, 'options': {'command': command}}]},
+        ]
+        settings.WORKERS = 2
+        files = FileRunner().run()
+        assert len(files) == 3
+        for file in files:  # every command runs in the directory of its file
+            assert os.path.realpath(file.contents) == os.path.realpath(file.path.directory)
+
+    @pytest.mark.parametrize('processor, is_kept', (
+        (DroppingProcessor, False),
+        (StoppingProcessor, True),
+        (RaisingProcessor, True),
+    ), ids=('none', 'stop', 'stop-processing'))
+    def test_stopping_processing(self, is_kept, processor, settings, src_dir):
+        settings.RULES = [{'test': '*.txt', 'processors': [{'processor': processor}, {'processor': FailingProcessor}]}]
+        names = _get_names(FileRunner().run(), src_dir)
+        assert sorted(names) == (sorted(['x.txt', 'y.txt', os.path.join('sub', 'z.txt')]) if is_kept else [])
+
+    @pytest.mark.parametrize('path', (
+        os.path.join('src', 'a.md'),
+        os.path.join('src', 'a.b', 'c.md'),
+        os.path.join('src', 'a.b', 'Makefile'),
+        os.path.join('src', 'Makefile'),
+        os.path.join('src', 'x.b'),
+        os.path.join('src', 'noext'),
+        os.path.join('src', '.hidden'),
+        os.path.join('src', 'a.txt'),
+        os.path.join('src', 'a.min.js'),
+        os.path.join('src', 'a.js'),
+        os.path.join('src', 'a.tar.gz'),
+    ))
+    def test_getting_rule_like_linear_scan(self, path, settings):
+        settings.RULES = [
+            {'test': '*.md', 'processors': []},
+            {'test': os.path.join('*', 'a.b', '*'), 'processors': []},
+            {'retest': r'Makefile\Z', 'processors': []},
+            {'test': '*.b', 'processors': []},
+            {'test': '*.min.js', 'processors': []},
+            {'test': '*.js', 'processors': []},
+            {'retest': r'\.(txt|gz)\Z', 'processors': []},
+            {'test': '*.txt', 'processors': []},
+        ]
+        runner = FileRunner()
+        expected_rule = next((rule for rule in runner._rules if rule.test(path)), None)
+        assert runner._get_rule(path) is expected_rule
+
+    def test_ignoring_dirs(self, settings, src_dir):
+        for name in ('node_modules', '.git', os.path.join('sub', 'node_modules')):
+            (src_dir / name).mkdir()
+            (src_dir / name / 'ignored.txt').write_text('ignored', encoding='utf-8')
+        settings.IGNORE_DIRS = ['node_modules', '.git']
+        settings.RULES = [{'test': '*.txt', 'processors': []}]
+        runner = FileRunner()
+        names = _get_names(runner.run(), src_dir)
+        assert sorted(names) == sorted(['x.txt', 'y.txt', os.path.join('sub', 'z.txt')])
+        # the same paths are skipped when the source directory is watched
+        assert not runner.is_path_applicable(str(src_dir / 'node_modules' / 'ignored.txt'))
+        assert not runner.is_path_applicable(str(src_dir / 'sub' / 'node_modules' / 'new' / 'new.txt'))
+        assert runner.is_path_applicable(str(src_dir / 'sub' / 'new.txt'))
+        assert runner.is_path_applicable(str(src_dir / 'node_modules.txt'))  # only directories are ignored
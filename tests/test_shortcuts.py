@@ -0,0 +1,66 @@
+import copy
+import pickle
+import pytest
+
+from gena.processors import BundleProcessor, ProcessorSpec
+from gena.shortcuts import bundle, cssmin
+
+
+class TestBundle:
+    def test_rule(self):
+        rule = bundle('test')
+        assert isinstance(rule, ProcessorSpec)
+        assert rule.processor is BundleProcessor
+        assert rule.options == {'name': 'test'}
+
+    def test_rule_as_dict(self):
+        rule = bundle('test')
+        assert rule['processor'] is BundleProcessor
+        assert rule.get('options') == {'name': 'test'}
+        assert rule.get('missing') is None
+        assert 'options' in rule
+        assert 'missing' not in rule
+        assert {**rule} == dict(rule) == {'processor': BundleProcessor, 'options': {'name': 'test'}}
+        with pytest.raises(KeyError):
+            assert rule['missing']
+
+    def test_rule_is_read_only(self):
+        rule = bundle('test')
+        with pytest.raises(AttributeError):
+            rule.processor = None
+        with pytest.raises(TypeError):
+            rule.options['name'] = None
+
+    def test_copying_rule(self):
+        rule = bundle('test')
+        assert copy.copy(rule) is rule
+        assert copy.deepcopy(rule) is rule
+
+    def test_copying_rules(self):
+        rules = {'test': '*.css', 'processors': [bundle('test'), cssmin('cssmin')]}
+        rules_copy = copy.deepcopy(rules)
+        assert rules_copy == rules
+        assert rules_copy['processors'] is not rules['processors']
+        assert rules_copy['processors'][0] is rules['processors'][0]
+
+    def test_pickling_rule(self):
+        rule = pickle.loads(pickle.dumps(bundle('test')))
+        assert isinstance(rule, ProcessorSpec)
+        assert rule.processor is BundleProcessor
+        assert rule.options == {'name': 'test'}
+        with pytest.raises(TypeError):
+            rule.options['name'] = None
+
+
+class TestCssmin:
+    def test_rule_with_string_args(self):
+        assert cssmin('cssmin').options['command'] == ('cssmin',)
+
+    def test_rule_with_list_args(self):
+        assert cssmin(['cssmin', '--verbose']).options['command'] == ('cssmin', '--verbose')
+
+    def test_rule_is_read_only(self):
+        rule = cssmin('cssmin')
+        with pytest.raises(TypeError):
+            rule.options['command'] = ('cssmin', '--verbose')
+        assert copy.deepcopy(rule).options['command'] == ('cssmin',)
@@ -0,0 +1,80 @@
+import asyncio
+import pytest
+import os
+import subprocess
+import sys
+
+from gena.templating import JinjaTemplateEngine
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RENDERING_SCRIPT = '''
+import jinja2, sys
+from gena.settings import settings
+from gena.templating import JinjaTemplateEngine
+settings.TEMPLATE_DIRS, settings.CACHE_DIR = sys.argv[1:]
+settings.JINJA_OPTIONS = {'autoescape': jinja2.select_autoescape(['html'])}
+print(JinjaTemplateEngine().render('value.html', {'value': '<b>'}), end='')
+'''
+
+
+@pytest.fixture
+def template_settings(settings, tmp_path):
+    templates_dir = tmp_path / 'templates'
+    templates_dir.mkdir()
+    (templates_dir / 'value.html').write_text('{{ value }}', encoding='utf-8')
+    settings.TEMPLATE_DIRS = str(templates_dir)
+    settings.CACHE_DIR = str(tmp_path / 'cache')
+    return settings
+
+
+class TestJinjaTemplateEngine:
+    def test_bytecode_cache_with_changed_options(self, template_settings, tmp_path):
+        assert JinjaTemplateEngine().render('value.html', {'value': '<b>'}) == '<b>'
+        template_settings.JINJA_OPTIONS = {'autoescape': True}
+        assert JinjaTemplateEngine().render('value.html', {'value': '<b>'}) == '&lt;b&gt;'
+        assert len(list((tmp_path / 'cache' / 'jinja').iterdir())) == 2  # a cache file for every set of options
+
+    @pytest.mark.slow
+    def test_bytecode_cache_in_several_processes(self, template_settings, tmp_path):
+        args = [sys.executable, '-c', RENDERING_SCRIPT, template_settings.TEMPLATE_DIRS, template_settings.CACHE_DIR]
+        env = {**os.environ, 'PYTHONPATH': ROOT_DIR}
+        for _ in range(2):
+            process = subprocess.run(args, env=env, stdout=subprocess.PIPE, check=True, universal_newlines=True)
+            assert process.stdout == '&lt;b&gt;'
+        assert len(list((tmp_path / 'cache' / 'jinja').iterdir())) == 1  # the same cache file for both builds
+
+    def test_bytecode_cache_with_unstable_options(self, template_settings, tmp_path):
+        template_settings.JINJA_OPTIONS = {'finalize': lambda value: f'[{value}]'}
+        assert JinjaTemplateEngine().render('value.html', {'value': 'test'}) == '[test]'
+        assert not (tmp_path / 'cache' / 'jinja').exists()
+
+    def test_async_rendering(self, template_settings):
+        template_settings.JINJA_ASYNC = True
+        engine = JinjaTemplateEngine()
+        assert asyncio.run(engine.render_async('value.html', {'value': 'test'})) == 'test'
+        assert engine.render('value.html', {'value': 'test'}) == 'test'
+
+    def test_async_rendering_with_workers(self, template_settings):
+        template_settings.JINJA_ASYNC = True
+        template_settings.WORKERS = 2
+        jobs = [('value.html', {'value': value}) for value in range(10)]
+        assert JinjaTemplateEngine().render_many(jobs) == [str(value) for value in range(10)]
+
+    @pytest.mark.parametrize('first_async', (False, True), ids=('sync-to-async', 'async-to-sync'))
+    def test_bytecode_cache_with_changed_async_mode(self, first_async, template_settings):
+        template_settings.JINJA_ASYNC = first_async
+        assert JinjaTemplateEngine().render('value.html', {'value': 'test'}) == 'test'
+        template_settings.JINJA_ASYNC = not first_async
+        engine = JinjaTemplateEngine()
+        assert engine.render('value.html', {'value': 'test'}) == 'test'
+        if not first_async:
+            assert asyncio.run(engine.render_async('value.html', {'value': 'test'})) == 'test'
+
+    @pytest.mark.parametrize('workers', (1, 2, None))
+    def test_rendering_many_templates(self, monkeypatch, template_settings, workers):
+        monkeypatch.setattr(os, 'cpu_count', lambda: None)  # it can't always be determined
+        template_settings.WORKERS = workers
+        jobs = [('value.html', {'value': value}) for value in range(10)]
+        assert JinjaTemplateEngine().render_many(jobs) == [str(value) for value in range(10)]